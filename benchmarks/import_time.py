@@ -0,0 +1,63 @@
+"""Fail if `from blaseball_reference import api` gets slow or starts importing requests/models eagerly.
+
+Run from the repo root: python benchmarks/import_time.py [budget_ms]
+"""
+import compileall
+import os
+import subprocess
+import sys
+
+# Measured at about 1ms; the budget leaves room for slower CI runners, not for new eager imports.
+BUDGET_MS = 3
+RUNS = 5
+CODE = (
+    'import sys; from blaseball_reference import api; '
+    'print("\\n".join(m for m in sys.modules if m == "requests" or m.startswith("blaseball_reference.models")))'
+)
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # Measure warm imports: compile the package up front, then take the fastest of several runs.
+    compileall.compile_dir(os.path.join(repo_root, 'blaseball_reference'), quiet=1)
+    results = [
+        subprocess.run(
+            [sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', CODE],
+            cwd=repo_root, capture_output=True, text=True, check=True,
+        )
+        for _ in range(RUNS)
+    ]
+    total_ms = min(_import_ms(result.stderr) for result in results)
+
+    failures = []
+    eager = results[0].stdout.split()
+    if eager:
+        failures.append(f'imported eagerly: {", ".join(eager)}')
+    if total_ms > budget_ms:
+        failures.append(f'import took {total_ms:.1f}ms, budget is {budget_ms:.1f}ms')
+
+    if failures:
+        for failure in failures:
+            print(f'FAIL: {failure}')
+        sys.exit(1)
+    print(f'OK: import took {total_ms:.1f}ms, budget is {budget_ms:.1f}ms')
+
+
+def _import_ms(importtime_output):
+    # Lines look like "import time:   self [us] | cumulative | imported package". Only count the top level
+    # blaseball_reference imports; their cumulative time includes everything they pull in.
+    total_us = 0
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        if name.strip() in ('blaseball_reference', 'blaseball_reference.api') and not name.startswith('  '):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+if __name__ == '__main__':
+    main()
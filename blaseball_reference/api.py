@@ -1,17 +1,42 @@
 """API for api dot blaseball-reference dot com"""
-from collections import OrderedDict
-import requests
-
-from blaseball_reference.models.game_event import GameEvent, EventType
+import importlib
 
 API_VERSION = 'v1'
 BASE_URL = 'https://api.blaseball-reference.com'
 
 
+# `requests` and the models are imported on first use so that importing this module stays cheap. Functions here
+# import them locally; `__getattr__` keeps `api.requests`, `api.GameEvent` and `api.EventType` working for callers.
+_LAZY_IMPORTS = {
+    'requests': ('requests', None),
+    'GameEvent': ('blaseball_reference.models.game_event', 'GameEvent'),
+    'EventType': ('blaseball_reference.models.game_event', 'EventType'),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
 def construct_url(endpoint):
     return f'{BASE_URL}/{API_VERSION}/{endpoint}'
 
 
+def _get(endpoint, params=None):
+    """GET an endpoint and raise on error."""
+    import requests
+    response = requests.get(construct_url(endpoint), params=params)
+    response.raise_for_status()
+    return response
+
+
 def prepare_id(id_):
     """if id_ is string uuid, return as is, if list, format as comma separated list."""
     if isinstance(id_, list):
@@ -32,8 +57,7 @@ provided as their own lists and are not mapped into their parents, and thus must
     """
     if not kwargs.get('are_you_sure'):
         raise Exception('Please mind the datablase.')
-    response = requests.get(construct_url('data/events'), params={'season': season})
-    response.raise_for_status()
+    response = _get('data/events', params={'season': season})
     # I'm not going to try to format a raw data dump. This is on you.
     return response.json()
 
@@ -58,6 +82,7 @@ def events(player_id=None,
 
     Returns an iterator of `GameEvent` objects.
     """
+    from blaseball_reference.models.game_event import GameEvent, EventType
 
     params = {
         'baseRunners': base_runners,
@@ -74,13 +99,12 @@ def events(player_id=None,
     else:
         raise ValueError('No ID specified!')
 
-    if isinstance(type_, GameEvent):
+    if isinstance(type_, EventType):
         type_ = type_.name
     if type_:
         params['type'] = type_
 
-    response = requests.get(construct_url('events'), params=params)
-    response.raise_for_status()
+    response = _get('events', params=params)
     results = response.json()['results']
     for game_event in results:
         yield GameEvent(**game_event)
@@ -100,6 +124,7 @@ def count_by_type(event_type, pitcher_id=None, batter_id=None):
         }
     }
     """
+    from blaseball_reference.models.game_event import EventType
     if isinstance(event_type, EventType):
         event_type = event_type.name
     params = {
@@ -110,8 +135,7 @@ def count_by_type(event_type, pitcher_id=None, batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('countByType'), params=params)
-    response.raise_for_status()
+    response = _get('countByType', params=params)
     res = response.json()
     return {
         'pitchers': {pitcher['pitcher_id']: pitcher['count'] for pitcher in res.get('pitchers', [])},
@@ -128,8 +152,7 @@ def plate_appearances(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('plateAppearances'), params=params)
-    response.raise_for_status()
+    response = _get('plateAppearances', params=params)
     return {
         batter['batter_id']: batter['count'] for batter in response.json()['results']
     }
@@ -144,8 +167,7 @@ def at_bats(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('atBats'), params=params)
-    response.raise_for_status()
+    response = _get('atBats', params=params)
     return {
         batter['batter_id']: batter['count'] for batter in response.json()['results']
     }
@@ -160,8 +182,7 @@ def hits(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('hits'), params=params)
-    response.raise_for_status()
+    response = _get('hits', params=params)
     return {
         batter['batter_id']: batter['count'] for batter in response.json()['results']
     }
@@ -176,8 +197,7 @@ def times_on_base(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('timesOnBase'), params=params)
-    response.raise_for_status()
+    response = _get('timesOnBase', params=params)
     return {
         batter['batter_id']: batter['count'] for batter in response.json()['results']
     }
@@ -192,8 +212,7 @@ def batting_average(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('battingAverage'), params=params)
-    response.raise_for_status()
+    response = _get('battingAverage', params=params)
     return {
         batter['id']: batter['value'] for batter in response.json()['results']
     }
@@ -208,8 +227,7 @@ def on_base_percentage(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('onBasePercentage'), params=params)
-    response.raise_for_status()
+    response = _get('onBasePercentage', params=params)
     return {
         batter['id']: batter['value'] for batter in response.json()['results']
     }
@@ -224,8 +242,7 @@ def on_base_plus_slugging(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('OnBasePlusSlugging'), params=params)
-    response.raise_for_status()
+    response = _get('OnBasePlusSlugging', params=params)
     return {
         batter['id']: batter['value'] for batter in response.json()['results']
     }
@@ -240,8 +257,7 @@ def slugging(batter_id=None):
     if batter_id:
         params['batterId'] = prepare_id(batter_id)
 
-    response = requests.get(construct_url('slugging'), params=params)
-    response.raise_for_status()
+    response = _get('slugging', params=params)
     return {
         batter['id']: batter['value'] for batter in response.json()['results']
     }
@@ -256,8 +272,7 @@ def outs_recorded(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('outsRecorded'), params=params)
-    response.raise_for_status()
+    response = _get('outsRecorded', params=params)
     return {
         pitcher['pitcher_id']: pitcher['count'] for pitcher in response.json()['results']
     }
@@ -272,8 +287,7 @@ def hits_recorded(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('hitsRecorded'), params=params)
-    response.raise_for_status()
+    response = _get('hitsRecorded', params=params)
     return {
         pitcher['pitcher_id']: pitcher['count'] for pitcher in response.json()['results']
     }
@@ -288,8 +302,7 @@ def walks_recorded(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('walksRecorded'), params=params)
-    response.raise_for_status()
+    response = _get('walksRecorded', params=params)
     return {
         pitcher['pitcher_id']: pitcher['count'] for pitcher in response.json()['results']
     }
@@ -304,8 +317,7 @@ def earned_runs(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('earnedRuns'), params=params)
-    response.raise_for_status()
+    response = _get('earnedRuns', params=params)
     return {
         pitcher['id']: pitcher['value'] for pitcher in response.json()['results']
     }
@@ -321,8 +333,7 @@ def whip(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('whip'), params=params)
-    response.raise_for_status()
+    response = _get('whip', params=params)
     return {
         pitcher['id']: pitcher['value'] for pitcher in response.json()['results']
     }
@@ -338,8 +349,7 @@ def era(pitcher_id=None):
     if pitcher_id:
         params['pitcherId'] = prepare_id(pitcher_id)
 
-    response = requests.get(construct_url('era'), params=params)
-    response.raise_for_status()
+    response = _get('era', params=params)
     return {
         pitcher['id']: pitcher['value'] for pitcher in response.json()['results']
     }
@@ -350,8 +360,7 @@ def player_attrs(player_id):
     params = {
         'playerId': player_id,
     }
-    response = requests.get(construct_url('playerAttrs'), params=params)
-    response.raise_for_status()
+    response = _get('playerAttrs', params=params)
     return response.json()
 
 
@@ -360,8 +369,7 @@ def current_roster(team_id):
     params = {
         'teamId': team_id,
     }
-    response = requests.get(construct_url('current_roster'), params=params)
-    response.raise_for_status()
+    response = _get('current_roster', params=params)
     return response.json()
 
 
@@ -374,8 +382,7 @@ def season_leaders(season, category, stat, order=None, limit=None):
         params["order"] = order
     if limit:
         params["limit"] = limit
-    response = requests.get(construct_url('seasonLeaders'), params=params)
-    response.raise_for_status()
+    response = _get('seasonLeaders', params=params)
     return response.json()
 
 
@@ -385,6 +392,5 @@ def player_stats(player_ids, category, season=None):
     params["category"] = category
     if season:
         params["season"] = season
-    response = requests.get(construct_url('playerStats'), params=params)
-    response.raise_for_status()
+    response = _get('playerStats', params=params)
     return response.json()
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""Stream GameEvent, BaseRunner, and PlayerEvent records to Parquet, Arrow IPC, or CSV files.
+
+Records are written in row groups of `row_group_size`, so memory use is bounded by the row group rather than
+the size of the export. Parquet and Arrow IPC need `pyarrow` (`pip install blaseball-reference[export]`);
+CSV only needs the standard library.
+"""
+import csv
+import enum
+import json
+import os
+import warnings
+
+from blaseball_reference.models.base_runner import BaseRunner
+from blaseball_reference.models.game_event import BattedBallType, EventType, GameEvent, PitchType
+from blaseball_reference.models.player_event import PlayerEvent, PlayerEventType
+
+DEFAULT_ROW_GROUP_SIZE = 10000
+FORMATS = ('parquet', 'arrow', 'csv')
+
+# Column types: 'int', 'str', 'bool', 'str_list', an Enum class, or [Enum] for a list of enum members. Enum columns
+# are stored by member name and dictionary-encoded against every member of the enum, so each row group shares the
+# same dictionary.
+GAME_EVENT_COLUMNS = [
+    ('id', 'int'),
+    ('game_id', 'str'),
+    ('event_type', EventType),
+    ('event_index', 'int'),
+    ('inning', 'int'),
+    ('top_of_inning', 'bool'),
+    ('outs_before_play', 'int'),
+    ('batter_id', 'str'),
+    ('batter_team_id', 'str'),
+    ('pitcher_id', 'str'),
+    ('pitcher_team_id', 'str'),
+    ('home_score', 'int'),
+    ('away_score', 'int'),
+    ('home_strike_count', 'int'),
+    ('away_strike_count', 'int'),
+    ('batter_count', 'int'),
+    ('pitches', [PitchType]),
+    ('total_strikes', 'int'),
+    ('total_balls', 'int'),
+    ('total_fouls', 'int'),
+    ('is_leadoff', 'bool'),
+    ('is_pinch_hit', 'bool'),
+    ('lineup_position', 'int'),
+    ('is_last_event_for_plate_appearance', 'bool'),
+    ('bases_hit', 'int'),
+    ('runs_batted_in', 'int'),
+    ('is_sacrifice_hit', 'bool'),
+    ('is_sacrifice_fly', 'bool'),
+    ('outs_on_play', 'int'),
+    ('is_double_play', 'bool'),
+    ('is_triple_play', 'bool'),
+    ('is_wild_pitch', 'bool'),
+    ('batted_ball_type', BattedBallType),
+    ('is_bunt', 'bool'),
+    ('errors_on_play', 'int'),
+    ('batter_base_after_play', 'int'),
+    ('is_last_game_event', 'bool'),
+    ('event_text', 'str_list'),
+    ('additional_context', 'str'),
+]
+
+BASE_RUNNER_COLUMNS = [
+    ('id', 'int'),
+    ('game_event_id', 'int'),
+    ('runner_id', 'str'),
+    ('responsible_pitcher_id', 'str'),
+    ('base_before_play', 'int'),
+    ('base_after_play', 'int'),
+    ('was_base_stolen', 'bool'),
+    ('was_caught_stealing', 'bool'),
+    ('was_picked_off', 'bool'),
+]
+
+PLAYER_EVENT_COLUMNS = [
+    ('id', 'int'),
+    ('game_event_id', 'int'),
+    ('player_id', 'str'),
+    ('event_type', PlayerEventType),
+]
+
+
+def export_game_events(game_events, path, format_='parquet', row_group_size=DEFAULT_ROW_GROUP_SIZE,
+                       base_runners_path=None, player_events_path=None):
+    """Write game events to `path`, one row group at a time.
+
+    `game_events` is any iterable of `GameEvent` objects (such as the iterator from `api.events`) or raw game event
+    dicts (such as those from `api.raw_events`). It is only iterated once.
+    `format_`: str One of "parquet", "arrow" (Arrow IPC file), or "csv".
+    `row_group_size`: int The number of rows buffered before each write.
+    `base_runners_path`: str Also write each game event's nested base runners here, in the same pass.
+    `player_events_path`: str Also write each game event's nested player events here, in the same pass.
+
+    Nested base runners and player events without a path are not written, and a warning is raised if any are found.
+
+    Returns the number of game event rows written.
+    """
+    outputs = [(GAME_EVENT_COLUMNS, path, lambda game_event: [game_event])]
+    if base_runners_path:
+        outputs.append((BASE_RUNNER_COLUMNS, base_runners_path, lambda game_event: game_event.base_runners))
+    if player_events_path:
+        outputs.append((PLAYER_EVENT_COLUMNS, player_events_path, lambda game_event: game_event.player_events))
+
+    def check_dropped(game_event):
+        dropped = []
+        if not base_runners_path and game_event.base_runners:
+            dropped.append('base_runners (pass base_runners_path)')
+        if not player_events_path and game_event.player_events:
+            dropped.append('player_events (pass player_events_path)')
+        if dropped:
+            warnings.warn(f'Nested {" and ".join(dropped)} are not exported.')
+            return True
+        return False
+
+    def game_events_with_check():
+        warned = False
+        for game_event in _to_models(game_events, GameEvent):
+            if not warned:
+                warned = check_dropped(game_event)
+            yield game_event
+
+    return _export(game_events_with_check(), outputs, format_, row_group_size)[0]
+
+
+def export_base_runners(base_runners, path, format_='parquet', row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """Write base runners to `path`, one row group at a time.
+
+    `base_runners` is any iterable of `BaseRunner` objects or raw base runner dicts.
+    See `export_game_events` for `format_` and `row_group_size`.
+
+    Returns the number of rows written.
+    """
+    outputs = [(BASE_RUNNER_COLUMNS, path, lambda base_runner: [base_runner])]
+    return _export(_to_models(base_runners, BaseRunner), outputs, format_, row_group_size)[0]
+
+
+def export_player_events(player_events, path, format_='parquet', row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """Write player events to `path`, one row group at a time.
+
+    `player_events` is any iterable of `PlayerEvent` objects or raw player event dicts.
+    See `export_game_events` for `format_` and `row_group_size`.
+
+    Returns the number of rows written.
+    """
+    outputs = [(PLAYER_EVENT_COLUMNS, path, lambda player_event: [player_event])]
+    return _export(_to_models(player_events, PlayerEvent), outputs, format_, row_group_size)[0]
+
+
+def _export(records, outputs, format_, row_group_size):
+    """Stream `records` to every output in one pass.
+
+    `outputs` is a list of (columns, path, rows_for) where `rows_for(record)` returns the model objects to write
+    for that record. Returns the number of rows written to each output.
+    """
+    if format_ not in FORMATS:
+        raise ValueError(f'Unknown export format: {format_}')
+    if row_group_size < 1:
+        raise ValueError(f'row_group_size must be positive: {row_group_size}')
+
+    # Write to temporary files so a failed export never leaves a finished-looking file behind.
+    writer_class = _CsvWriter if format_ == 'csv' else _ArrowWriter
+    writers = []
+    try:
+        for columns, path, _ in outputs:
+            writers.append(writer_class(columns, f'{path}.part', format_, row_group_size))
+        for record in records:
+            for writer, (columns, _, rows_for) in zip(writers, outputs):
+                for row_record in rows_for(record):
+                    writer.write(_to_row(row_record, columns))
+        for writer in writers:
+            writer.close()
+    except BaseException:
+        for writer in writers:
+            writer.abort()
+        for _, path, _ in outputs:
+            if os.path.exists(f'{path}.part'):
+                os.remove(f'{path}.part')
+        raise
+
+    for _, path, _ in outputs:
+        os.replace(f'{path}.part', path)
+    return [writer.count for writer in writers]
+
+
+def _to_models(records, model):
+    for record in records:
+        yield model(**record) if isinstance(record, dict) else record
+
+
+def _to_row(record, columns):
+    return [_coerce(getattr(record, name), type_) for name, type_ in columns]
+
+
+def _coerce(value, type_):
+    """Convert a model attribute to the column type, e.g. '3' to 3 for an int column or 0 to False for a bool column."""
+    if value is None:
+        return None
+    if type_ == 'int':
+        return int(value)
+    if type_ == 'str':
+        return str(value)
+    if type_ == 'bool':
+        if isinstance(value, str):
+            return value.lower() in ('true', 't', '1')
+        return bool(value)
+    if type_ == 'str_list':
+        if isinstance(value, str):
+            return [value]
+        return [None if v is None else str(v) for v in value]
+    if isinstance(type_, list):
+        return [None if v is None else v.name for v in value]
+    return value.name if isinstance(value, enum.Enum) else value
+
+
+class _CsvWriter(object):
+    """Writes rows to a CSV file as they arrive. List columns are written as JSON."""
+
+    def __init__(self, columns, path, format_, row_group_size):
+        self.count = 0
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in columns])
+
+    def write(self, row):
+        self._writer.writerow([json.dumps(v) if isinstance(v, list) else v for v in row])
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+
+
+class _ArrowWriter(object):
+    """Buffers rows and writes them to a Parquet or Arrow IPC file every `row_group_size` rows."""
+
+    def __init__(self, columns, path, format_, row_group_size):
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                f'Exporting to {format_} requires pyarrow: pip install blaseball-reference[export]') from None
+
+        self.count = 0
+        self._closed = False
+        self._pa = pa
+        self._columns = columns
+        self._row_group_size = row_group_size
+        self._buffered = []
+        self._schema = pa.schema([(name, _arrow_type(pa, type_)) for name, type_ in columns])
+        members = {name: [e.name for e in _enum_type(type_)] for name, type_ in columns if _enum_type(type_)}
+        self._lookups = {name: {k: i for i, k in enumerate(names)} for name, names in members.items()}
+        self._dictionaries = {name: pa.array(names, pa.string()) for name, names in members.items()}
+
+        if format_ == 'parquet':
+            self._sink = None
+            self._writer = pq.ParquetWriter(path, self._schema)
+        else:
+            self._sink = pa.OSFile(path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+    def write(self, row):
+        self._buffered.append(row)
+        if len(self._buffered) >= self._row_group_size:
+            self._flush()
+
+    def close(self):
+        if self._buffered:
+            self._flush()
+        self.abort()
+
+    def abort(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def _flush(self):
+        batch = self._to_batch(self._buffered)
+        if self._sink is None:
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self.count += len(self._buffered)
+        self._buffered = []
+
+    def _encode(self, name, values):
+        indices = self._pa.array([self._lookups[name].get(v) for v in values], self._pa.int32())
+        return self._pa.DictionaryArray.from_arrays(indices, self._dictionaries[name])
+
+    def _to_batch(self, buffered):
+        pa = self._pa
+        arrays = []
+        for i, (name, type_) in enumerate(self._columns):
+            values = [row[i] for row in buffered]
+            if isinstance(type_, list):
+                offsets = [0]
+                flat = []
+                for value in values:
+                    flat.extend(value or [])
+                    offsets.append(len(flat))
+                mask = pa.array([value is None for value in values])
+                arrays.append(pa.ListArray.from_arrays(pa.array(offsets, pa.int32()), self._encode(name, flat),
+                                                       mask=mask))
+            elif name in self._dictionaries:
+                arrays.append(self._encode(name, values))
+            else:
+                arrays.append(pa.array(values, self._schema.field(name).type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+
+
+def _arrow_type(pa, type_):
+    if type_ == 'int':
+        return pa.int64()
+    if type_ == 'str':
+        return pa.string()
+    if type_ == 'bool':
+        return pa.bool_()
+    if type_ == 'str_list':
+        return pa.list_(pa.string())
+    if isinstance(type_, list):
+        return pa.list_(pa.dictionary(pa.int32(), pa.string()))
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _enum_type(type_):
+    """The Enum class behind an enum or list-of-enum column type, or None."""
+    if isinstance(type_, list):
+        type_ = type_[0]
+    if isinstance(type_, type) and issubclass(type_, enum.Enum):
+        return type_
+    return None
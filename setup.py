@@ -15,4 +15,7 @@ setuptools.setup(
     long_description=long_desc,
     long_description_content_type='text/markdown',
     packages=setuptools.find_packages(),
+    extras_require={
+        'export': ['pyarrow'],
+    },
 )
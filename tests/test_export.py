@@ -0,0 +1,138 @@
+import csv
+import json
+import os
+
+import pytest
+
+from blaseball_reference import export
+from blaseball_reference.models.game_event import GameEvent
+
+
+def game_event(id_, **kwargs):
+    record = {
+        'id': id_,
+        'game_id': 'game',
+        'event_type': 'SINGLE',
+        'inning': 1,
+        'pitches': ['B', 'X'],
+        'batted_ball_type': 'L',
+        'event_text': ['text'],
+        'base_runners': [{'id': id_, 'game_event_id': id_, 'base_before_play': 0, 'base_after_play': 1}],
+        'player_events': [{'id': id_, 'game_event_id': id_, 'event_type': 'PEANUT_GOOD'}],
+    }
+    record.update(kwargs)
+    return record
+
+
+def read_arrow(path, format_):
+    pa = pytest.importorskip('pyarrow')
+    if format_ == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(path)
+    import pyarrow.ipc
+    return pa.ipc.open_file(path).read_all()
+
+
+@pytest.mark.parametrize('format_', ['parquet', 'arrow'])
+def test_arrow_round_trip(tmp_path, format_):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'events.{format_}')
+
+    count = export.export_game_events([game_event(1), GameEvent(**game_event(2))], path, format_,
+                                      base_runners_path=str(tmp_path / 'runners'),
+                                      player_events_path=str(tmp_path / 'players'))
+
+    assert count == 2
+    table = read_arrow(path, format_)
+    rows = table.to_pylist()
+    assert [row['id'] for row in rows] == [1, 2]
+    assert rows[0]['event_type'] == 'SINGLE'
+    assert rows[0]['batted_ball_type'] == 'LINE_DRIVE'
+    assert rows[0]['pitches'] == ['BALL', 'HIT']
+    assert rows[0]['event_text'] == ['text']
+    assert str(table.schema.field('event_type').type) == 'dictionary<values=string, indices=int32, ordered=0>'
+    assert str(table.schema.field('pitches').type.value_type).startswith('dictionary')
+    assert read_arrow(str(tmp_path / 'runners'), format_).column('base_after_play').to_pylist() == [1, 1]
+    assert read_arrow(str(tmp_path / 'players'), format_).column('event_type').to_pylist() == ['PEANUT_GOOD'] * 2
+
+
+def test_csv_round_trip(tmp_path):
+    path = str(tmp_path / 'events.csv')
+
+    count = export.export_game_events([game_event(1, player_events=[])], path, 'csv',
+                                      base_runners_path=str(tmp_path / 'runners.csv'))
+
+    assert count == 1
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]['id'] == '1'
+    assert rows[0]['event_type'] == 'SINGLE'
+    assert json.loads(rows[0]['pitches']) == ['BALL', 'HIT']
+    with open(tmp_path / 'runners.csv', newline='') as f:
+        assert [row['runner_id'] for row in csv.DictReader(f)] == ['']
+
+
+def test_row_groups_split_at_row_group_size(tmp_path):
+    pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    path = str(tmp_path / 'events.parquet')
+
+    export.export_game_events((game_event(i) for i in range(5)), path, row_group_size=2,
+                              base_runners_path=str(tmp_path / 'runners.parquet'),
+                              player_events_path=str(tmp_path / 'players.parquet'))
+
+    metadata = pq.ParquetFile(path).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [2, 2, 1]
+
+
+@pytest.mark.parametrize('format_', ['parquet', 'arrow'])
+def test_missing_and_unknown_enums_are_null(tmp_path, format_):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'events.{format_}')
+    record = game_event(1, pitches=['B', '?'], batted_ball_type=None, player_events=[], base_runners=[])
+
+    export.export_game_events([record], path, format_)
+
+    row = read_arrow(path, format_).to_pylist()[0]
+    assert row['batted_ball_type'] is None
+    assert row['pitches'] == ['BALL', None]
+
+
+def test_values_are_coerced_to_column_types(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'runners.parquet')
+
+    export.export_base_runners([{'id': '1', 'base_before_play': '3', 'was_base_stolen': 0,
+                                 'was_picked_off': 'false'}], path)
+
+    row = read_arrow(path, 'parquet').to_pylist()[0]
+    assert row['id'] == 1
+    assert row['base_before_play'] == 3
+    assert row['was_base_stolen'] is False
+    assert row['was_picked_off'] is False
+
+
+@pytest.mark.parametrize('format_', ['parquet', 'arrow', 'csv'])
+def test_failed_export_leaves_no_file(tmp_path, format_):
+    if format_ != 'csv':
+        pytest.importorskip('pyarrow')
+    path = str(tmp_path / f'runners.{format_}')
+
+    def runners():
+        yield {'id': 1}
+        yield {'id': 'not a number'}
+
+    with pytest.raises(ValueError):
+        export.export_base_runners(runners(), path, format_, row_group_size=1)
+    assert os.listdir(tmp_path) == []
+
+
+def test_dropped_children_warn(tmp_path):
+    with pytest.warns(UserWarning, match='player_events_path'):
+        export.export_game_events([game_event(1)], str(tmp_path / 'events.csv'), 'csv',
+                                  base_runners_path=str(tmp_path / 'runners.csv'))
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        export.export_game_events([], str(tmp_path / 'events.xlsx'), 'xlsx')